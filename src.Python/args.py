@@ -9,17 +9,107 @@ Module for parsing command line arguments.
 """
 
 import argparse
+import ctypes
+import functools
 import socket
-import ipaddress
-import subprocess
 from argparse import Namespace
 
 
+class _sockaddr(ctypes.Structure):
+    _fields_ = [
+            ("sa_family", ctypes.c_uint16),
+            ("sa_data", ctypes.c_uint8 * 14),
+            ]
+
+
+class _sockaddr_in(ctypes.Structure):
+    _fields_ = [
+            ("sin_family", ctypes.c_uint16),
+            ("sin_port", ctypes.c_uint16),
+            ("sin_addr", ctypes.c_uint8 * 4),
+            ("sin_zero", ctypes.c_uint8 * 8),
+            ]
+
+
+class _ifaddrs(ctypes.Structure):
+    pass
+
+
+_ifaddrs._fields_ = [
+        ("ifa_next", ctypes.POINTER(_ifaddrs)),
+        ("ifa_name", ctypes.c_char_p),
+        ("ifa_flags", ctypes.c_uint),
+        ("ifa_addr", ctypes.POINTER(_sockaddr)),
+        ("ifa_netmask", ctypes.POINTER(_sockaddr)),
+        ("ifa_ifu", ctypes.POINTER(_sockaddr)),
+        ("ifa_data", ctypes.c_void_p),
+        ]
+
+
+def _local_ipv4_addrs() -> set:
+    """
+    [RU]
+    Возвращает множество IPv4 адресов локальных интерфейсов через
+    прямой вызов getifaddrs(3), без запуска внешних процессов.
+
+    Аргументы:
+        None: Функция не принимает аргументов.
+
+    Возвращает:
+        set: Множество строк с IPv4 адресами.
+
+    Вызывает:
+        OSError: Если перечисление интерфейсов недоступно.
+
+    [EN]
+    Returns the set of local interface IPv4 addresses via a direct
+    getifaddrs(3) call, without spawning external processes.
+
+    Args:
+        None: Function does not accept arguments.
+
+    Returns:
+        set: Set of IPv4 address strings.
+
+    Raises:
+        OSError: If interface enumeration is unavailable.
+    """
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        getifaddrs = libc.getifaddrs
+        freeifaddrs = libc.freeifaddrs
+    except (OSError, AttributeError):
+        raise OSError("getifaddrs недоступен на этой платформе")
+
+    head = ctypes.POINTER(_ifaddrs)()
+    if getifaddrs(ctypes.byref(head)) != 0:
+        raise OSError(ctypes.get_errno(), "getifaddrs failed")
+
+    addrs = set()
+    try:
+        node = head
+        while node:
+            ifa = node.contents
+            sa = ifa.ifa_addr
+            if sa and sa.contents.sa_family == socket.AF_INET:
+                sin = ctypes.cast(sa, ctypes.POINTER(_sockaddr_in)).contents
+                addrs.add(socket.inet_ntoa(bytes(sin.sin_addr)))
+            node = ifa.ifa_next
+    finally:
+        freeifaddrs(head)
+    return addrs
+
+
+# Повторные проверки того же адреса (перезапуски, тесты) отвечают
+# из кэша без перечисления интерфейсов; is_ip_valid.cache_clear()
+# сбрасывает кэш при изменении конфигурации сети
+@functools.lru_cache(maxsize=32)
 def is_ip_valid(ip: str) -> tuple[bool, str]:
     """
     [RU]
     Проверяет валидность IP адреса и возвращает сообщение об ошибке.
-    
+    Результат кэшируется по адресу (см. cache_clear()).
+
     Аргументы:
         ip (str): IP адрес для проверки.
         
@@ -28,7 +118,8 @@ def is_ip_valid(ip: str) -> tuple[bool, str]:
         
     [EN]
     Validates IP address and returns error message.
-    
+    The result is cached per address (see cache_clear()).
+
     Args:
         ip (str): IP address to validate.
         
@@ -36,29 +127,34 @@ def is_ip_valid(ip: str) -> tuple[bool, str]:
         tuple[bool, str]: (validity, error message).
     """
     # Проверка 1: Корректность формата IPv4
+    # inet_aton — один вызов C без создания объекта IPv4Address;
+    # дополнительно требуем строго четыре десятичных октета,
+    # так как inet_aton принимает и сокращенные формы ("1.2.3").
+    # Ведущие нули отклоняются: inet_aton трактует их как octal
+    # ("010" == 8), что расходится с десятичной записью пользователя
     try:
-        ipaddress.IPv4Address(ip)
-    except ipaddress.AddressValueError:
+        socket.inet_aton(ip)
+        parts = ip.split('.')
+        if len(parts) != 4 or not all(
+                p.isdigit() and int(p) <= 255 and (len(p) == 1 or p[0] != '0')
+                for p in parts):
+            raise ValueError
+    except (OSError, ValueError):
         return False, f"Некорректный формат IP адреса: '{ip}'. Ожидается IPv4 адрес в формате X.X.X.X"
 
-    # Проверка 2: Существование IP адреса на машине через ip addr show
+    # Проверка 2: Существование IP адреса на машине через getifaddrs —
+    # прямой системный вызов вместо fork/exec внешней команды ip.
+    # Ответ перечисления авторитетен: дополнительная тестовая привязка
+    # сокета не нужна
     try:
-        result = subprocess.run(
-                ['ip', 'addr', 'show'],
-                capture_output=True,
-                text=True,
-                timeout=3
-                )
-        if result.returncode == 0 and ip in result.stdout:
-            # IP найден в интерфейсах, проверяем возможность привязки
-            pass
-        else:
-            return False, f"IP адрес '{ip}' не найден на текущей машине."
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        # Если команда ip недоступна, переходим к проверке сокета
+        if ip in _local_ipv4_addrs():
+            return True, "IP адрес валиден"
+        return False, f"IP адрес '{ip}' не найден на текущей машине."
+    except OSError:
+        # Перечисление интерфейсов недоступно, переходим к проверке сокета
         pass
 
-    # Проверка 3: Возможность привязки к сокету
+    # Проверка 3 (резервная): Возможность привязки к сокету
     test_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     try:
         test_socket.bind((ip, 0))
@@ -112,6 +208,27 @@ def parse_args() -> Namespace:
             help='UDP порт для приема и отправки сообщений'
             )
 
+    parser.add_argument(
+            '--log-dir',
+            type=str,
+            default=None,
+            help='Директория для файлов логов (по умолчанию логирование в файл отключено)'
+            )
+
+    parser.add_argument(
+            '--log-level',
+            type=str,
+            choices=('DEBUG', 'INFO', 'WARNING', 'ERROR'),
+            default='INFO',
+            help='Минимальный уровень логирования (по умолчанию INFO)'
+            )
+    parser.add_argument(
+            '--binary-frames',
+            action='store_true',
+            help='Отправлять бинарные кадры v2 вместо JSON '
+                 '(прием понимает оба формата)'
+            )
+
     args = parser.parse_args()
 
     # Валидация IP адреса с сообщением об ошибке
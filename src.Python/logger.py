@@ -0,0 +1,599 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+[RU]
+Модуль логирования с фоновым потоком записи.
+
+[EN]
+Logging module with a background writer thread.
+"""
+
+import os
+import queue
+import sys
+import threading
+import time
+from typing import List, Optional
+
+# Сентинел для остановки потока записи
+_STOP_SENTINEL = None
+
+# Числовые уровни логирования
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+# Готовые префиксы уровней для потока записи
+_LEVEL_PREFIX = {"DEBUG": "[DEBUG] ", "INFO": "[INFO] ",
+                 "WARNING": "[WARNING] ", "ERROR": "[ERROR] "}
+
+
+class LoggerManager:
+    """
+    [RU]
+    Менеджер логирования с пакетной записью в файл.
+
+    Вызовы логирования только кладут строку в очередь; отдельный
+    фоновый поток собирает строки пачками и пишет их одним вызовом,
+    чтобы горячие потоки (прием/отправка/UI) не блокировались на I/O.
+
+    [EN]
+    Logging manager with batched file writes.
+
+    Logging calls only enqueue a line; a dedicated background thread
+    collects lines in batches and writes them in one call, so hot
+    threads (rx/tx/UI) never block on I/O.
+    """
+
+    # Фиксированный набор атрибутов: прямой доступ по слоту
+    # быстрее словарного и экономит память экземпляра
+    __slots__ = ('log_dir', 'enable_file_logging', 'console_output', 'min_level',
+                 'batch_max', 'flush_interval',
+                 '_depth', '_name_stack', '_indents', '_indent', '_stack_lock', '_fd',
+                 'log_file_path', '_log_queue', '_writer', '_ts_sec', '_ts_str')
+
+    def __init__(self, log_dir: Optional[str] = None, enable_file_logging: bool = False,
+                 console_output: bool = True, min_level: int = LEVELS["INFO"],
+                 batch_max: int = 128, flush_interval: float = 0.05):
+        """
+        [RU]
+        Инициализация менеджера логирования.
+
+        Аргументы:
+            log_dir (Optional[str]): Директория для файлов логов.
+            enable_file_logging (bool): Включить запись в файл.
+            console_output (bool): Включить вывод в консоль.
+            min_level (int): Минимальный уровень сообщений (см. LEVELS).
+            batch_max (int): Максимум записей в одной пачке записи.
+            flush_interval (float): Максимальная задержка сброса
+                пачки на диск, в секундах.
+
+        Возвращает:
+            None: Конструктор не возвращает значение.
+
+        [EN]
+        Initialize logging manager.
+
+        Args:
+            log_dir (Optional[str]): Directory for log files.
+            enable_file_logging (bool): Enable file logging.
+            console_output (bool): Enable console output.
+            min_level (int): Minimum message level (see LEVELS).
+            batch_max (int): Maximum records per write batch.
+            flush_interval (float): Maximum delay before a batch is
+                flushed to disk, in seconds.
+
+        Returns:
+            None: Constructor does not return a value.
+        """
+        self.log_dir: str = log_dir or "logs"
+        self.enable_file_logging: bool = enable_file_logging
+        self.console_output: bool = console_output
+        self.min_level: int = min_level
+        self.batch_max: int = batch_max
+        self.flush_interval: float = flush_interval
+        # Глубина вложенности как счетчик + фиксированный буфер имен:
+        # вход/выход из функции обходится без append/pop списка
+        self._depth: int = 0
+        self._name_stack: List[Optional[str]] = [None] * 64
+        # Предвычисленные отступы по глубине стека: без пересборки
+        # "    " * n на каждый вызов логирования
+        self._indents = tuple("    " * i for i in range(64))
+        self._indent: str = ""
+        # Узкая блокировка только для стека вызовов: путь
+        # логирования (_write_log) блокировок не берет вовсе
+        self._stack_lock = threading.Lock()
+        # Сырой файловый дескриптор: запись через os.write минует
+        # кодировщик и блокировку TextIOWrapper
+        self._fd: Optional[int] = None
+        self.log_file_path: Optional[str] = None
+
+        # Очередь строк и фоновый поток записи.
+        # SimpleQueue реализована на C: постановка в очередь не
+        # берет Python-блокировку
+        self._log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+
+        # Кэш секундной части временной метки (только поток записи)
+        self._ts_sec: int = 0
+        self._ts_str: str = ""
+
+        if self.enable_file_logging:
+            self._setup_file_logging()
+
+        self._writer = threading.Thread(target=self._drain, daemon=True)
+        self._writer.start()
+
+    def _setup_file_logging(self) -> None:
+        """
+        [RU]
+        Настройка записи логов в файл.
+
+        Аргументы:
+            None: Функция не принимает аргументов.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Setup file logging.
+
+        Args:
+            None: Function does not accept arguments.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        try:
+            # makedirs(exist_ok=True) вместо пары exists/makedirs;
+            # проверка os.access убрана - она дублирует ошибку open
+            # и подвержена гонке TOCTOU, недоступность каталога
+            # проявится как OSError при os.open ниже
+            os.makedirs(self.log_dir, mode=0o755, exist_ok=True)
+
+            # PID в имени файла позволяет параллельные экземпляры;
+            # O_EXCL исключает тихую перезапись при гонке
+            # time.strftime обходится без создания объекта datetime
+            timestamp = time.strftime("%Y-%m-%d_%H-%M-%S", time.localtime())
+            base = f"{timestamp}_{os.getpid()}_chat"
+            for attempt in range(100):
+                suffix = "" if attempt == 0 else f"_{attempt}"
+                path = os.path.join(self.log_dir, f"{base}{suffix}.log")
+                try:
+                    self._fd = os.open(path,
+                                       os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_APPEND,
+                                       0o644)
+                    self.log_file_path = path
+                    return
+                except FileExistsError:
+                    continue
+            self.enable_file_logging = False
+        except OSError:
+            self.enable_file_logging = False
+            self._fd = None
+
+    def _drain(self) -> None:
+        """
+        [RU]
+        Цикл фонового потока записи: собирает строки пачками
+        и пишет их одним вызовом, сбрасывая буфер по таймауту.
+
+        Аргументы:
+            None: Функция не принимает аргументов.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Background writer loop: collects lines in batches and writes
+        them in one call, flushing on timeout.
+
+        Args:
+            None: Function does not accept arguments.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        batch_max = self.batch_max
+        flush_interval = self.flush_interval
+        while True:
+            record = self._log_queue.get()
+            if record is _STOP_SENTINEL:
+                break
+
+            # Копим записи до batch_max либо до истечения окна
+            # flush_interval: один вызов записи на всю пачку
+            batch = [record]
+            deadline = time.monotonic() + flush_interval
+            while len(batch) < batch_max:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        extra = self._log_queue.get(timeout=remaining)
+                    else:
+                        extra = self._log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if extra is _STOP_SENTINEL:
+                    self._write_batch(batch)
+                    return
+                batch.append(extra)
+
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: List[tuple]) -> None:
+        """
+        [RU]
+        Форматирование и запись пачки записей в файл и/или на консоль.
+
+        Аргументы:
+            batch (List[tuple]): Кортежи (уровень, отступ, шаблон,
+                аргументы, метка времени).
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Format and write a batch of records to file and/or console.
+
+        Args:
+            batch (List[tuple]): (level, indent, template, args, ts)
+                tuples.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        parts = []
+        for level, indent, message, args, ts in batch:
+            # Отложенное %-форматирование: аргументы подставляются
+            # только здесь, когда запись уже прошла фильтр уровня
+            if args:
+                message = message % args
+            # strftime вызывается не чаще раза в секунду, миллисекунды
+            # дописываются из дробной части time.time()
+            sec = int(ts)
+            if sec != self._ts_sec:
+                self._ts_sec = sec
+                self._ts_str = time.strftime("%H:%M:%S.", time.localtime(sec))
+            # join фиксированного кортежа быстрее f-строки: без
+            # парсинга шаблона и промежуточных преобразований
+            parts.append(''.join((self._ts_str, '%03d ' % int((ts - sec) * 1000),
+                                  _LEVEL_PREFIX[level], indent, message, '\n')))
+        text = "".join(parts)
+        if self.console_output:
+            try:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+            except (OSError, ValueError):
+                pass
+        if self.enable_file_logging and self._fd is not None:
+            try:
+                # Одна системная запись на пачку, без стека TextIOWrapper
+                os.write(self._fd, text.encode('utf-8'))
+            except OSError:
+                pass
+
+    def _write_log(self, level: str, message: str, args: tuple = ()) -> None:
+        """
+        [RU]
+        Ставит запись лога в очередь потока записи.
+
+        Аргументы:
+            level (str): Уровень сообщения.
+            message (str): Текст сообщения или %-шаблон.
+            args (tuple): Аргументы для отложенной подстановки.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Enqueues a log record for the writer thread.
+
+        Args:
+            level (str): Message level.
+            message (str): Message text or %-style template.
+            args (tuple): Arguments for deferred interpolation.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        # Без блокировки и без форматирования: горячий поток только
+        # ставит кортеж, строку собирает поток записи
+        self._log_queue.put((level, self._indent, message, args, time.time()))
+
+    def debug(self, message: str, *args) -> None:
+        """
+        [RU]
+        Логирование отладочного сообщения. Аргументы подставляются
+        в %-шаблон только когда запись прошла фильтр уровня.
+
+        Аргументы:
+            message (str): Текст сообщения или %-шаблон.
+            *args: Аргументы для отложенной подстановки.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Log a debug message. Arguments are interpolated into the
+        %-template only once the record has passed the level filter.
+
+        Args:
+            message (str): Message text or %-style template.
+            *args: Arguments for deferred interpolation.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        if self.min_level > 10:
+            return
+        self._write_log("DEBUG", message, args)
+
+    def info(self, message: str, *args) -> None:
+        """
+        [RU]
+        Логирование информационного сообщения.
+
+        Аргументы:
+            message (str): Текст сообщения или %-шаблон.
+            *args: Аргументы для отложенной подстановки.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Log an info message.
+
+        Args:
+            message (str): Message text or %-style template.
+            *args: Arguments for deferred interpolation.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        if self.min_level > 20:
+            return
+        self._write_log("INFO", message, args)
+
+    def warning(self, message: str, *args) -> None:
+        """
+        [RU]
+        Логирование предупреждения.
+
+        Аргументы:
+            message (str): Текст сообщения или %-шаблон.
+            *args: Аргументы для отложенной подстановки.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Log a warning message.
+
+        Args:
+            message (str): Message text or %-style template.
+            *args: Arguments for deferred interpolation.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        if self.min_level > 30:
+            return
+        self._write_log("WARNING", message, args)
+
+    def error(self, message: str, *args) -> None:
+        """
+        [RU]
+        Логирование ошибки.
+
+        Аргументы:
+            message (str): Текст сообщения или %-шаблон.
+            *args: Аргументы для отложенной подстановки.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Log an error message.
+
+        Args:
+            message (str): Message text or %-style template.
+            *args: Arguments for deferred interpolation.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        self._write_log("ERROR", message, args)
+
+    def is_enabled(self, level: str) -> bool:
+        """
+        [RU]
+        Проверка, пройдет ли сообщение уровня level фильтр.
+        Позволяет вызывающему коду не готовить дорогие аргументы
+        для заведомо отброшенной записи.
+
+        Аргументы:
+            level (str): Имя уровня (см. LEVELS).
+
+        Возвращает:
+            bool: True если уровень не ниже порога.
+
+        [EN]
+        Check whether a message of the given level passes the filter.
+        Lets callers skip preparing expensive arguments for a record
+        that would be dropped anyway.
+
+        Args:
+            level (str): Level name (see LEVELS).
+
+        Returns:
+            bool: True if the level is at or above the threshold.
+        """
+        return LEVELS.get(level, 40) >= self.min_level
+
+    def start_function(self, name: str) -> None:
+        """
+        [RU]
+        Вход в функцию: увеличивает отступ вложенности логов.
+
+        Аргументы:
+            name (str): Имя функции.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Function entry: increases log nesting indent.
+
+        Args:
+            name (str): Function name.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        with self._stack_lock:
+            if self._depth < 64:
+                self._name_stack[self._depth] = name
+            self._depth += 1
+            self._indent = self._indents[min(self._depth, 63)]
+
+    def stop_function(self, name: str) -> None:
+        """
+        [RU]
+        Выход из функции: уменьшает отступ вложенности логов.
+
+        Аргументы:
+            name (str): Имя функции.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Function exit: decreases log nesting indent.
+
+        Args:
+            name (str): Function name.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        expected = None
+        with self._stack_lock:
+            if self._depth <= 0:
+                return
+            # Декремент безусловный: несимметричный вызов не должен
+            # замораживать счетчик глубины. Сверка имени возможна
+            # только для записанных элементов (глубина <= 64) и при
+            # расхождении лишь предупреждает
+            if self._depth <= 64 and self._name_stack[self._depth - 1] != name:
+                expected = self._name_stack[self._depth - 1]
+            self._depth -= 1
+            self._indent = self._indents[min(self._depth, 63)]
+        if expected is not None:
+            self.warning("Несбалансированный stop_function: ожидалось '%s', получено '%s'",
+                         expected, name)
+
+    def get_call_stack(self) -> List[str]:
+        """
+        [RU]
+        Получение копии текущего стека вызовов.
+
+        Аргументы:
+            None: Функция не принимает аргументов.
+
+        Возвращает:
+            List[str]: Копия стека вызовов.
+
+        [EN]
+        Get a copy of the current call stack.
+
+        Args:
+            None: Function does not accept arguments.
+
+        Returns:
+            List[str]: Call stack copy.
+        """
+        with self._stack_lock:
+            return self._name_stack[:min(self._depth, 64)]
+
+    def set_console_output(self, enabled: bool) -> None:
+        """
+        [RU]
+        Включение/отключение вывода логов в консоль.
+
+        Аргументы:
+            enabled (bool): Новое состояние вывода.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Enable/disable console log output.
+
+        Args:
+            enabled (bool): New output state.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        # Ранний выход без записи, если состояние не меняется;
+        # присваивание bool атомарно в CPython - блокировка не нужна
+        enabled = bool(enabled)
+        if enabled == self.console_output:
+            return
+        self.console_output = enabled
+
+    def call_stack_depth(self) -> int:
+        """
+        [RU]
+        Текущая глубина стека вызовов без копирования списка.
+        Чтение int атомарно - блокировка не требуется.
+
+        Аргументы:
+            None: Функция не принимает аргументов.
+
+        Возвращает:
+            int: Глубина стека вызовов.
+
+        [EN]
+        Current call stack depth without copying the list.
+        Reading an int is atomic - no lock needed.
+
+        Args:
+            None: Function does not accept arguments.
+
+        Returns:
+            int: Call stack depth.
+        """
+        return self._depth
+
+    def cleanup(self) -> None:
+        """
+        [RU]
+        Завершение логирования: останавливает поток записи
+        и закрывает файл лога.
+
+        Аргументы:
+            None: Функция не принимает аргументов.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Shutdown logging: stops the writer thread and closes
+        the log file.
+
+        Args:
+            None: Function does not accept arguments.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        self._log_queue.put(_STOP_SENTINEL)
+        if self._writer is not None:
+            self._writer.join(timeout=2)
+        if self._fd is not None:
+            try:
+                os.fsync(self._fd)
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
@@ -10,11 +10,54 @@ Main UDP chat module.
 
 import sys
 import locale
-from queue import Queue
-import time
+import signal
+from queue import SimpleQueue
 from args import parse_args
+from logger import LEVELS, LoggerManager
 from net import UdpReceiverThread, UdpSenderThread
 
+# Флаг однократной установки обработчиков сигналов
+_handlers_installed = False
+
+
+def _install_signal_handlers(tx_thread):
+    """
+    [RU]
+    Однократная установка обработчика SIGTERM с цепочкой к
+    предыдущему обработчику.
+
+    Аргументы:
+        tx_thread (UdpSenderThread): Поток отправки для остановки.
+
+    Возвращает:
+        None: Функция не возвращает значение.
+
+    [EN]
+    One-time SIGTERM handler installation chaining to the previous
+    handler.
+
+    Args:
+        tx_thread (UdpSenderThread): Sender thread to stop.
+
+    Returns:
+        None: Function does not return a value.
+    """
+    global _handlers_installed
+    if _handlers_installed:
+        return
+
+    prev_term = signal.getsignal(signal.SIGTERM)
+
+    # Обработчик делает минимум работы: только установка флага
+    # остановки, затем цепочка к предыдущему обработчику
+    def _signal_handler(signum, frame):
+        tx_thread.request_stop()
+        if callable(prev_term):
+            prev_term(signum, frame)
+
+    signal.signal(signal.SIGTERM, _signal_handler)
+    _handlers_installed = True
+
 
 def main():
     """
@@ -37,6 +80,7 @@ def main():
         None: Function does not return a value.
     """
     rx_thread, tx_thread = None, None
+    logger = None
 
     try:
         # Настройка локализации для поддержки кириллицы
@@ -45,12 +89,31 @@ def main():
         # Разбор аргументов командной строки
         args = parse_args()
 
-        # Создание очереди для сообщений
-        rx_queue = Queue()
+        # Логирование: вывод в консоль отключен, чтобы не ломать curses
+        logger = LoggerManager(
+                log_dir=args.log_dir,
+                enable_file_logging=args.log_dir is not None,
+                console_output=False,
+                min_level=LEVELS[args.log_level]
+                )
+        logger.info(f"Запуск чата на {args.ip}:{args.port}")
+
+        # Очередь входящих сообщений: SimpleQueue реализована на C
+        # и не берет Python-блокировку на put/get
+        rx_queue = SimpleQueue()
 
         # Создание потоков
-        rx_thread = UdpReceiverThread(rx_queue, args.ip, args.port)
-        tx_thread = UdpSenderThread(rx_queue, args.ip, args.port)
+        rx_thread = UdpReceiverThread(rx_queue, args.ip, args.port, logger=logger)
+        tx_thread = UdpSenderThread(rx_queue, args.ip, args.port, logger=logger,
+                                    binary_frames=args.binary_frames)
+
+        # Собственные broadcast-пакеты фильтруются на приеме:
+        # пользователь видит локальное эхо из queue_message
+        rx_thread.set_self_addr(tx_thread.s_socket.getsockname())
+
+        # Обработчик SIGTERM: вся очистка выполняется в главном
+        # потоке после join()
+        _install_signal_handlers(tx_thread)
 
         # Запуск потоков
         rx_thread.start()
@@ -59,23 +122,28 @@ def main():
         print(f"Запуск чата на {args.ip}:{args.port}")
         print("Нажмите Ctrl+C для выхода")
 
-        # Ожидание завершения потоков
-        while rx_thread.is_alive() or tx_thread.is_alive():
-            time.sleep(0.1)
+        # Блокирующее ожидание завершения UI потока вместо опроса:
+        # join() спит в ядре и прерывается KeyboardInterrupt в главном потоке
+        tx_thread.join()
+
+        # UI завершился — останавливаем поток приема
+        rx_thread.stop()
+        rx_thread.join(timeout=2)
 
     except KeyboardInterrupt:
         print("\nПолучен сигнал прерывания. Завершение...")
 
-        # Завершение потоков
-        if 'rx_thread' in locals():
+        # Завершение потоков: проверка по сентинелу None вместо
+        # сборки словаря locals() на каждое условие
+        if rx_thread is not None:
             rx_thread.stop()
-        if 'tx_thread' in locals():
+        if tx_thread is not None:
             tx_thread.stop()
 
         # Ждем завершения с таймаутом
-        if 'rx_thread' in locals():
+        if rx_thread is not None:
             rx_thread.join(timeout=2)
-        if 'tx_thread' in locals():
+        if tx_thread is not None:
             tx_thread.join(timeout=2)
 
     except Exception as e:
@@ -84,14 +152,17 @@ def main():
     finally:
         # Дополнительная очистка
         try:
-            if 'rx_thread' in locals() and rx_thread.is_alive():
+            if rx_thread is not None and rx_thread.is_alive():
                 rx_thread.stop()
                 rx_thread.join(timeout=1)
-            if 'tx_thread' in locals() and tx_thread.is_alive():
+            if tx_thread is not None and tx_thread.is_alive():
                 tx_thread.stop()
                 tx_thread.join(timeout=1)
         except:
             pass
+        if logger is not None:
+            logger.info("Чат завершен")
+            logger.cleanup()
         print("Чат завершен.")
 
 
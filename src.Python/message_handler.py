@@ -0,0 +1,541 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+[RU]
+Модуль сборки и разбора сообщений чата.
+
+[EN]
+Chat message building and parsing module.
+"""
+
+import json
+import struct
+from typing import Dict, NamedTuple, Optional
+
+# orjson — опциональное ускорение (SIMD-парсер, bytes на выходе);
+# при отсутствии используется стандартный json
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# pysimdjson — опциональный SIMD-парсер для пути приема: валидация
+# UTF-8 и разбор структуры выполняются за один проход по буферу
+try:
+    import simdjson as _simdjson
+except ImportError:
+    _simdjson = None
+
+# Маркеры фиксированной схемы датаграммы, которую производит
+# build_outgoing_message: точный порядок ключей и без экранирования
+_FAST_PREFIX = b'{"nickname":"'
+_FAST_MID = b'","message":"'
+_FAST_SUFFIX = b'"}'
+
+# Кэшированный кодировщик для резервного пути без orjson:
+# json.dumps с нестандартными параметрами создает JSONEncoder на
+# каждый вызов; компактные разделители дают тот же формат провода,
+# что и быстрый путь (без пробелов)
+_json_encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+_json_encode_ascii = json.JSONEncoder(separators=(',', ':')).encode
+
+
+def _json_encode_str(s: str) -> str:
+    """
+    [RU]
+    Кодирует строку в JSON-литерал, выбирая для чисто ASCII строк
+    кодировщик ensure_ascii=True: его C-ветка обходится без проверок
+    суррогатных пар, а результат для ASCII идентичен.
+
+    Аргументы:
+        s (str): Строка для кодирования.
+
+    Возвращает:
+        str: JSON-литерал строки в кавычках.
+
+    [EN]
+    Encodes a string as a JSON literal, picking the
+    ensure_ascii=True encoder for pure-ASCII strings: its C branch
+    skips the surrogate-pair checks and the output is identical for
+    ASCII input.
+
+    Args:
+        s (str): String to encode.
+
+    Returns:
+        str: Quoted JSON string literal.
+    """
+    if s.isascii():
+        return _json_encode_ascii(s)
+    return _json_encode(s)
+
+# Бинарный кадр v2: magic(2) | nick_len(1) | msg_len(2) | nick | msg.
+# Прием понимает оба формата всегда; отправка в бинарном виде
+# включается явно (совместимость с JSON-партнерами сохраняется)
+_V2_MAGIC = b'CH'
+_V2_HEADER = struct.Struct('!BH')
+_V2_HDR_LEN = len(_V2_MAGIC) + _V2_HEADER.size
+
+
+class ChatMsg(NamedTuple):
+    """
+    [RU]
+    Разобранное сообщение чата. Кортеж с именованными полями:
+    доступ по индексу вместо поиска по хешу ключа и ~в пять раз
+    меньше памяти на сообщение, чем у dict.
+
+    [EN]
+    Parsed chat message. Named-field tuple: index access instead of
+    a key hash lookup and ~5x less memory per message than a dict.
+    """
+    nickname: str
+    message: str
+
+
+def _strip_if_needed(s: str) -> str:
+    """
+    [RU]
+    Возвращает строку без краевых пробелов, копируя ее только при
+    их наличии: strip() на уже чистой строке все равно создает
+    новый объект.
+
+    Аргументы:
+        s (str): Исходная строка.
+
+    Возвращает:
+        str: Та же строка либо ее очищенная копия.
+
+    [EN]
+    Returns the string without surrounding whitespace, copying only
+    when any is present: strip() on an already-clean string still
+    allocates a new object.
+
+    Args:
+        s (str): Source string.
+
+    Returns:
+        str: The same string or its stripped copy.
+    """
+    # Срезы [:1]/[-1:] безопасны и для пустой строки
+    if s[:1].isspace() or s[-1:].isspace():
+        return s.strip()
+    return s
+
+
+class MessageHandler:
+    """
+    [RU]
+    Обработчик сообщений: сборка исходящих и разбор входящих
+    JSON-датаграмм с полями nickname и message.
+
+    [EN]
+    Message handler: builds outgoing and parses incoming JSON
+    datagrams with nickname and message fields.
+    """
+
+    def __init__(self, max_message_size: int = 1000, logger=None,
+                 binary_frames: bool = False):
+        """
+        [RU]
+        Инициализация обработчика сообщений.
+
+        Аргументы:
+            max_message_size (int): Максимальный размер текста
+                сообщения в байтах.
+            logger: Менеджер логирования (опционально).
+            binary_frames (bool): Отправлять бинарные кадры v2
+                вместо JSON (прием понимает оба формата всегда).
+
+        Возвращает:
+            None: Конструктор не возвращает значение.
+
+        [EN]
+        Initialize message handler.
+
+        Args:
+            max_message_size (int): Maximum message text size
+                in bytes.
+            logger: Logging manager (optional).
+            binary_frames (bool): Send v2 binary frames instead of
+                JSON (receive understands both formats always).
+
+        Returns:
+            None: Constructor does not return a value.
+        """
+        self.max_message_size: int = max_message_size
+        self.logger = logger
+        self.binary_frames: bool = binary_frames
+
+        # Кэш представлений фиксированного nickname сессии (JSON
+        # префикс и UTF-8 байты): на каждое сообщение кодируется
+        # только его текст
+        self._nickname: Optional[str] = None
+        self._nick_prefix: Optional[bytes] = None
+        self._nick_bytes: Optional[bytes] = None
+
+        # Переиспользуемый SIMD-парсер для пути приема
+        self._parser = _simdjson.Parser() if _simdjson is not None else None
+
+    def set_nickname(self, nickname: str) -> None:
+        """
+        [RU]
+        Фиксирует nickname сессии и предвычисляет JSON-префикс
+        датаграммы для быстрого пути сборки.
+
+        Аргументы:
+            nickname (str): Имя пользователя.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Pins the session nickname and precomputes the datagram JSON
+        prefix for the fast build path.
+
+        Args:
+            nickname (str): User nickname.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        nickname = _strip_if_needed(nickname)
+        if _orjson is not None:
+            nick_json = _orjson.dumps(nickname)
+        else:
+            nick_json = _json_encode_str(nickname).encode('utf-8')
+        self._nickname = nickname
+        self._nick_prefix = b'{"nickname":' + nick_json + b',"message":'
+        self._nick_bytes = nickname.encode('utf-8')
+
+    def validate_message_length(self, message: str) -> bool:
+        """
+        [RU]
+        Проверка, что текст сообщения не превышает лимит в байтах.
+
+        Аргументы:
+            message (str): Текст сообщения.
+
+        Возвращает:
+            bool: True если длина в пределах лимита.
+
+        [EN]
+        Check that message text does not exceed the byte limit.
+
+        Args:
+            message (str): Message text.
+
+        Returns:
+            bool: True if length is within the limit.
+        """
+        return self._utf8_len(message) <= self.max_message_size
+
+    @staticmethod
+    def _utf8_len(text: str) -> int:
+        """
+        [RU]
+        Длина строки в байтах UTF-8.
+
+        Аргументы:
+            text (str): Строка для измерения.
+
+        Возвращает:
+            int: Количество байт в кодировке UTF-8.
+
+        [EN]
+        String length in UTF-8 bytes.
+
+        Args:
+            text (str): String to measure.
+
+        Returns:
+            int: Byte count in UTF-8 encoding.
+        """
+        return len(text.encode('utf-8'))
+
+    def build_outgoing_message(self, nickname: str, message: str) -> bytes:
+        """
+        [RU]
+        Сборка исходящей датаграммы в формате JSON.
+
+        Аргументы:
+            nickname (str): Имя пользователя.
+            message (str): Текст сообщения.
+
+        Возвращает:
+            bytes: Сериализованная датаграмма в UTF-8.
+
+        Вызывает:
+            ValueError: Если сообщение превышает лимит длины.
+
+        [EN]
+        Build outgoing datagram in JSON format.
+
+        Args:
+            nickname (str): User nickname.
+            message (str): Message text.
+
+        Returns:
+            bytes: Serialized UTF-8 datagram.
+
+        Raises:
+            ValueError: If the message exceeds the length limit.
+        """
+        # Длина измеряется один раз; повторной сериализации ради
+        # проверки не выполняется
+        size = self._utf8_len(message)
+        if size > self.max_message_size:
+            raise ValueError(
+                    f"Сообщение слишком длинное: {size} байт "
+                    f"(максимум {self.max_message_size})"
+                    )
+
+        # Бинарный кадр v2 (опционально): struct.pack вместо JSON,
+        # при слишком длинном nickname - откат на JSON
+        if self.binary_frames:
+            # Для nickname сессии используются закэшированные байты
+            nick_text = _strip_if_needed(nickname)
+            if nick_text == self._nickname and self._nick_bytes is not None:
+                nick_bytes = self._nick_bytes
+            else:
+                nick_bytes = nick_text.encode('utf-8')
+            if len(nick_bytes) <= 255:
+                msg_bytes = _strip_if_needed(message).encode('utf-8')
+                return (_V2_MAGIC
+                        + _V2_HEADER.pack(len(nick_bytes), len(msg_bytes))
+                        + nick_bytes + msg_bytes)
+
+        # Быстрый путь: nickname сессии уже закодирован в префикс,
+        # кодируется только текст сообщения
+        if self._nick_prefix is not None and _strip_if_needed(nickname) == self._nickname:
+            body_text = _strip_if_needed(message)
+            if _orjson is not None:
+                body = _orjson.dumps(body_text)
+            else:
+                body = _json_encode_str(body_text).encode('utf-8')
+            return self._nick_prefix + body + b'}'
+
+        # Общий путь: датаграмма склеивается из закодированных полей
+        # без промежуточного словаря под сериализатор
+        nick_text = _strip_if_needed(nickname)
+        body_text = _strip_if_needed(message)
+        if _orjson is not None:
+            # orjson сразу возвращает bytes в UTF-8
+            return (b'{"nickname":' + _orjson.dumps(nick_text)
+                    + b',"message":' + _orjson.dumps(body_text) + b'}')
+        return ('{"nickname":' + _json_encode_str(nick_text)
+                + ',"message":' + _json_encode_str(body_text) + '}').encode('utf-8')
+
+    @staticmethod
+    def _parse_binary_frame(raw: bytes) -> Optional[ChatMsg]:
+        """
+        [RU]
+        Разбор бинарного кадра v2: пара распаковок struct и срезы,
+        без JSON-парсера. Несовпадение magic или длин возвращает
+        None — разбор продолжат JSON-пути.
+
+        Аргументы:
+            raw (bytes): Сырые данные датаграммы.
+
+        Возвращает:
+            Optional[ChatMsg]: Разобранное сообщение или None.
+
+        [EN]
+        Parse a v2 binary frame: a struct unpack and slices, no JSON
+        parser involved. A magic or length mismatch returns None and
+        the JSON paths take over.
+
+        Args:
+            raw (bytes): Raw datagram data.
+
+        Returns:
+            Optional[ChatMsg]: Parsed message or None.
+        """
+        if not raw.startswith(_V2_MAGIC) or len(raw) < _V2_HDR_LEN:
+            return None
+        nick_len, msg_len = _V2_HEADER.unpack_from(raw, len(_V2_MAGIC))
+        if len(raw) != _V2_HDR_LEN + nick_len + msg_len:
+            return None
+        nick_end = _V2_HDR_LEN + nick_len
+        try:
+            return ChatMsg(raw[_V2_HDR_LEN:nick_end].decode('utf-8'),
+                           raw[nick_end:].decode('utf-8'))
+        except UnicodeDecodeError:
+            return None
+
+    @staticmethod
+    def _parse_fixed_schema(raw: bytes) -> Optional[ChatMsg]:
+        """
+        [RU]
+        Специализированный разбор датаграммы фиксированной схемы
+        {"nickname":"...","message":"..."} парой поисков и срезов.
+        Любое отклонение (экранирование, иной порядок ключей,
+        лишние поля) возвращает None — разбор продолжит общий
+        JSON-парсер.
+
+        Аргументы:
+            raw (bytes): Сырые данные датаграммы.
+
+        Возвращает:
+            Optional[ChatMsg]: Разобранное сообщение или None.
+
+        [EN]
+        Specialized parse of the fixed-schema datagram
+        {"nickname":"...","message":"..."} with a couple of finds and
+        slices. Any deviation (escapes, different key order, extra
+        fields) returns None and the generic JSON parser takes over.
+
+        Args:
+            raw (bytes): Raw datagram data.
+
+        Returns:
+            Optional[ChatMsg]: Parsed message or None.
+        """
+        # Экранированные символы ломают срезы - уходим на общий путь
+        if (not raw.startswith(_FAST_PREFIX) or not raw.endswith(_FAST_SUFFIX)
+                or b'\\' in raw):
+            return None
+        mid = raw.find(_FAST_MID, len(_FAST_PREFIX))
+        if mid < 0:
+            return None
+        nick = raw[len(_FAST_PREFIX):mid]
+        msg = raw[mid + len(_FAST_MID):-len(_FAST_SUFFIX)]
+        # Неэкранированная кавычка внутри значения означает, что
+        # срезы прошли по чужим границам
+        if b'"' in nick or b'"' in msg:
+            return None
+        try:
+            return ChatMsg(nick.decode('utf-8'), msg.decode('utf-8'))
+        except UnicodeDecodeError:
+            return None
+
+    def parse_incoming_message(self, raw_data) -> Optional[ChatMsg]:
+        """
+        [RU]
+        Разбор входящей датаграммы.
+
+        Аргументы:
+            raw_data (bytes | memoryview | str): Сырые данные
+                датаграммы.
+
+        Возвращает:
+            Optional[ChatMsg]: Кортеж с полями nickname и
+                message или None, если формат некорректен.
+
+        [EN]
+        Parse incoming datagram.
+
+        Args:
+            raw_data (bytes | memoryview | str): Raw datagram data.
+
+        Returns:
+            Optional[ChatMsg]: Tuple with nickname and message
+                fields, or None if the format is invalid.
+        """
+        # Специализированный путь: датаграммы собственного формата
+        # разбираются парой find/срезов без JSON-парсера вообще
+        if not isinstance(raw_data, str):
+            raw = raw_data if isinstance(raw_data, bytes) else bytes(raw_data)
+            # Бинарный кадр v2 никогда не начинается с '{' - проверка
+            # magic дешевле любого JSON-пути
+            parsed = self._parse_binary_frame(raw)
+            if parsed is not None:
+                return parsed
+            parsed = self._parse_fixed_schema(raw)
+            if parsed is not None:
+                return parsed
+            raw_data = raw
+
+        # Быстрый путь: simdjson разбирает bytes без промежуточного
+        # словаря, извлекая только два нужных поля
+        if self._parser is not None and not isinstance(raw_data, str):
+            try:
+                doc = self._parser.parse(raw_data)
+                nickname = doc['nickname']
+                message = doc['message']
+            except (ValueError, KeyError, TypeError):
+                return None
+            # type(...) is str быстрее isinstance: без обхода MRO
+            if type(nickname) is str and type(message) is str:
+                return ChatMsg(nickname, message)
+            return None
+
+        try:
+            if _orjson is not None:
+                # orjson принимает любой буферный объект напрямую
+                obj = _orjson.loads(raw_data)
+            else:
+                # стандартный json не принимает memoryview
+                if isinstance(raw_data, memoryview):
+                    raw_data = raw_data.tobytes()
+                obj = json.loads(raw_data)
+        except (ValueError, TypeError):
+            return None
+
+        # Слитная проверка: get объединяет "ключ есть" и "тип верный"
+        # в одно обращение к словарю, type(...) is str - без обхода MRO
+        if type(obj) is dict:
+            nickname = obj.get('nickname')
+            message = obj.get('message')
+            if type(nickname) is str and type(message) is str:
+                return ChatMsg(nickname, message)
+        return None
+
+    def get_message_info(self, raw_data) -> Dict[str, bool]:
+        """
+        [RU]
+        Диагностическая информация о входящей датаграмме.
+
+        Аргументы:
+            raw_data (bytes | str): Сырые данные датаграммы.
+
+        Возвращает:
+            Dict[str, bool]: Флаги is_valid_json, has_nickname,
+                has_message.
+
+        [EN]
+        Diagnostic information about an incoming datagram.
+
+        Args:
+            raw_data (bytes | str): Raw datagram data.
+
+        Returns:
+            Dict[str, bool]: is_valid_json, has_nickname,
+                has_message flags.
+        """
+        # Бинарные кадры v2 - не JSON: быстрый путь для них не
+        # годится, флаг is_valid_json должен остаться False
+        if isinstance(raw_data, memoryview):
+            raw_data = raw_data.tobytes()
+        is_binary = (isinstance(raw_data, (bytes, bytearray))
+                     and raw_data.startswith(_V2_MAGIC))
+
+        # Корректная JSON-датаграмма отвечает на все три вопроса
+        # сразу, без повторного полного разбора
+        if not is_binary and self.parse_incoming_message(raw_data) is not None:
+            return {
+                    "is_valid_json": True,
+                    "has_nickname" : True,
+                    "has_message"  : True
+                    }
+
+        # Медленный путь только для некорректных датаграмм
+        info = {
+                "is_valid_json": False,
+                "has_nickname" : False,
+                "has_message"  : False
+                }
+        try:
+            if _orjson is not None:
+                obj = _orjson.loads(raw_data)
+            else:
+                if isinstance(raw_data, memoryview):
+                    raw_data = raw_data.tobytes()
+                obj = json.loads(raw_data)
+        except (ValueError, TypeError):
+            return info
+
+        info["is_valid_json"] = True
+        if isinstance(obj, dict):
+            info["has_nickname"] = isinstance(obj.get('nickname'), str)
+            info["has_message"] = isinstance(obj.get('message'), str)
+        return info
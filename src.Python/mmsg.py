@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+[RU]
+Модуль пакетного приема/отправки UDP датаграмм через recvmmsg(2)
+и sendmmsg(2) (ctypes-обертки над libc, только Linux).
+
+[EN]
+Batched UDP datagram receive/send module via recvmmsg(2) and
+sendmmsg(2) (ctypes bindings over libc, Linux only).
+"""
+
+import ctypes
+import errno
+import socket
+import sys
+from typing import List, Tuple
+
+# Флаг неблокирующего вызова recvmmsg
+MSG_DONTWAIT = 0x40
+
+
+class _iovec(ctypes.Structure):
+    _fields_ = [
+            ("iov_base", ctypes.c_void_p),
+            ("iov_len", ctypes.c_size_t),
+            ]
+
+
+class _sockaddr_in(ctypes.Structure):
+    _fields_ = [
+            ("sin_family", ctypes.c_uint16),
+            ("sin_port", ctypes.c_uint16),
+            ("sin_addr", ctypes.c_uint8 * 4),
+            ("sin_zero", ctypes.c_uint8 * 8),
+            ]
+
+
+class _msghdr(ctypes.Structure):
+    _fields_ = [
+            ("msg_name", ctypes.c_void_p),
+            ("msg_namelen", ctypes.c_uint32),
+            ("msg_iov", ctypes.POINTER(_iovec)),
+            ("msg_iovlen", ctypes.c_size_t),
+            ("msg_control", ctypes.c_void_p),
+            ("msg_controllen", ctypes.c_size_t),
+            ("msg_flags", ctypes.c_int),
+            ]
+
+
+class _mmsghdr(ctypes.Structure):
+    _fields_ = [
+            ("msg_hdr", _msghdr),
+            ("msg_len", ctypes.c_uint32),
+            ]
+
+
+# Доступность recvmmsg/sendmmsg определяется один раз при импорте
+available = False
+_recvmmsg = None
+_sendmmsg = None
+if sys.platform.startswith('linux'):
+    try:
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _recvmmsg = _libc.recvmmsg
+        _recvmmsg.restype = ctypes.c_int
+        _recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_mmsghdr),
+                              ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+        _sendmmsg = _libc.sendmmsg
+        _sendmmsg.restype = ctypes.c_int
+        _sendmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_mmsghdr),
+                              ctypes.c_uint, ctypes.c_int]
+        available = True
+    except (OSError, AttributeError):
+        available = False
+
+
+class RecvBatcher:
+    """
+    [RU]
+    Пакетный прием датаграмм: до vlen пакетов за один системный
+    вызов recvmmsg в заранее выделенные буферы.
+
+    [EN]
+    Batched datagram receive: up to vlen packets per recvmmsg
+    syscall into preallocated buffers.
+    """
+
+    def __init__(self, vlen: int = 32, bufsize: int = 2048):
+        """
+        [RU]
+        Инициализация: однократное выделение буферов и заголовков,
+        переиспользуемых между вызовами.
+
+        Аргументы:
+            vlen (int): Максимум датаграмм за один вызов.
+            bufsize (int): Размер буфера одной датаграммы.
+
+        Возвращает:
+            None: Конструктор не возвращает значение.
+
+        [EN]
+        Initialization: one-time allocation of buffers and headers
+        reused across calls.
+
+        Args:
+            vlen (int): Maximum datagrams per call.
+            bufsize (int): Single datagram buffer size.
+
+        Returns:
+            None: Constructor does not return a value.
+        """
+        self.vlen: int = vlen
+        self.bufsize: int = bufsize
+        self._bufs = [(ctypes.c_char * bufsize)() for _ in range(vlen)]
+        self._iovecs = (_iovec * vlen)()
+        self._addrs = (_sockaddr_in * vlen)()
+        self._hdrs = (_mmsghdr * vlen)()
+        for i in range(vlen):
+            self._iovecs[i].iov_base = ctypes.cast(self._bufs[i], ctypes.c_void_p)
+            self._iovecs[i].iov_len = bufsize
+            hdr = self._hdrs[i].msg_hdr
+            hdr.msg_name = ctypes.cast(ctypes.byref(self._addrs[i]), ctypes.c_void_p)
+            hdr.msg_namelen = ctypes.sizeof(_sockaddr_in)
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+
+    def recv(self, fd: int) -> List[Tuple[bytes, Tuple[str, int]]]:
+        """
+        [RU]
+        Неблокирующий прием скопившихся датаграмм одним вызовом.
+
+        Аргументы:
+            fd (int): Файловый дескриптор UDP сокета.
+
+        Возвращает:
+            List[Tuple[bytes, Tuple[str, int]]]: Список пар
+                (данные, (ip, порт)); пустой, если пакетов нет.
+
+        [EN]
+        Non-blocking receive of pending datagrams in one call.
+
+        Args:
+            fd (int): UDP socket file descriptor.
+
+        Returns:
+            List[Tuple[bytes, Tuple[str, int]]]: List of
+                (data, (ip, port)) pairs; empty when nothing pending.
+        """
+        n = _recvmmsg(fd, self._hdrs, self.vlen, MSG_DONTWAIT, None)
+        if n <= 0:
+            err = ctypes.get_errno()
+            if n < 0 and err not in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                raise OSError(err, "recvmmsg failed")
+            return []
+
+        result = []
+        for i in range(n):
+            length = self._hdrs[i].msg_len
+            addr = self._addrs[i]
+            ip = socket.inet_ntoa(bytes(addr.sin_addr))
+            port = socket.ntohs(addr.sin_port)
+            result.append((ctypes.string_at(self._bufs[i], length), (ip, port)))
+            # Длина адреса перезаписывается ядром - восстанавливаем
+            self._hdrs[i].msg_hdr.msg_namelen = ctypes.sizeof(_sockaddr_in)
+        return result
+
+
+class SendBatcher:
+    """
+    [RU]
+    Пакетная отправка датаграмм: до vlen пакетов за один системный
+    вызов sendmmsg на подключенном (connect) UDP сокете.
+
+    [EN]
+    Batched datagram send: up to vlen packets per sendmmsg syscall
+    on a connected UDP socket.
+    """
+
+    def __init__(self, vlen: int = 32):
+        """
+        [RU]
+        Инициализация: однократное выделение заголовков,
+        переиспользуемых между вызовами.
+
+        Аргументы:
+            vlen (int): Максимум датаграмм за один вызов.
+
+        Возвращает:
+            None: Конструктор не возвращает значение.
+
+        [EN]
+        Initialization: one-time allocation of headers reused
+        across calls.
+
+        Args:
+            vlen (int): Maximum datagrams per call.
+
+        Returns:
+            None: Constructor does not return a value.
+        """
+        self.vlen: int = vlen
+        self._iovecs = (_iovec * vlen)()
+        self._hdrs = (_mmsghdr * vlen)()
+        for i in range(vlen):
+            hdr = self._hdrs[i].msg_hdr
+            # Адрес назначения зафиксирован connect()-ом сокета
+            hdr.msg_name = None
+            hdr.msg_namelen = 0
+            hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            hdr.msg_iovlen = 1
+
+    def send(self, fd: int, payloads: List[bytes]) -> int:
+        """
+        [RU]
+        Отправка пачки датаграмм одним вызовом. iovec указывают
+        прямо на буферы bytes - без копирования данных.
+
+        Аргументы:
+            fd (int): Файловый дескриптор подключенного UDP сокета.
+            payloads (List[bytes]): Датаграммы для отправки.
+
+        Возвращает:
+            int: Количество отправленных датаграмм.
+
+        [EN]
+        Send a batch of datagrams in one call. The iovecs point
+        straight at the bytes buffers - no data copy.
+
+        Args:
+            fd (int): Connected UDP socket file descriptor.
+            payloads (List[bytes]): Datagrams to send.
+
+        Returns:
+            int: Number of datagrams sent.
+        """
+        count = min(len(payloads), self.vlen)
+        for i in range(count):
+            payload = payloads[i]
+            self._iovecs[i].iov_base = ctypes.cast(ctypes.c_char_p(payload),
+                                                   ctypes.c_void_p)
+            self._iovecs[i].iov_len = len(payload)
+        n = _sendmmsg(fd, self._hdrs, count, 0)
+        if n < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return 0
+            raise OSError(err, "sendmmsg failed")
+        return n
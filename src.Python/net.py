@@ -8,12 +8,20 @@
 Module for UDP network communication
 """
 
-import json
+import os
+import selectors
 import socket
 import threading
-from queue import Queue
+from queue import Empty, Full, Queue, SimpleQueue
+from message_handler import MessageHandler
 from ui import CursesChatUI
 from curses import wrapper
+import mmsg
+
+# Размер буферов сокетов: линуксовый дефолт (~208 КБ) мал для
+# всплесков broadcast трафика; фактический размер может быть
+# урезан ядром до net.core.rmem_max / wmem_max
+_SOCK_BUF_SIZE = 12 * 1024 * 1024
 
 
 class UdpReceiverThread(threading.Thread):
@@ -25,36 +33,143 @@ class UdpReceiverThread(threading.Thread):
     Thread for receiving UDP messages.
     """
 
-    def __init__(self, rx_queue: Queue, ip: str, port: int):
+    def __init__(self, rx_queue: SimpleQueue, ip: str, port: int, logger=None,
+                 bufsize: int = 2048):
         """
         [RU]
         Инициализация потока приемника UDP сообщений.
-        
+
         Аргументы:
-            rx_queue (Queue): Очередь для сообщений.
+            rx_queue (SimpleQueue): Очередь для сообщений.
             ip (str): IP адрес для идентификации подсети.
             port (int): UDP порт для прослушивания.
-            
+            logger: Менеджер логирования (опционально).
+            bufsize (int): Размер буфера приема одной датаграммы
+                в байтах.
+
         Возвращает:
             None: Конструктор не возвращает значение.
-            
+
         [EN]
         Initialize UDP message receiver thread.
 
         Args:
-            rx_queue (Queue): Message queue.
+            rx_queue (SimpleQueue): Message queue.
             ip (str): IP address to identify subnet.
             port (int): UDP port for listening.
+            logger: Logging manager (optional).
+            bufsize (int): Receive buffer size for one datagram
+                in bytes.
 
         Returns:
             None: Constructor does not return a value.
         """
         super().__init__(daemon=True)
-        self.queue: Queue = rx_queue
+        self.queue: SimpleQueue = rx_queue
         self.ip: str = ip
         self.port: int = port
-        self.running: bool = True
-        self.r_socket: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.logger = logger
+        self.message_handler = MessageHandler(logger=logger)
+        self._stop_event = threading.Event()
+        # Self-pipe для пробуждения селектора: stop() пишет байт,
+        # и select() возвращается немедленно вместо ожидания таймаута
+        self._wake_r, self._wake_w = os.pipe()
+        # SOCK_NONBLOCK/SOCK_CLOEXEC (где доступны) задают режим
+        # атомарно при создании: без окна блокирующего состояния и
+        # без утечки дескриптора в дочерние процессы
+        sock_type = (socket.SOCK_DGRAM
+                     | getattr(socket, 'SOCK_NONBLOCK', 0)
+                     | getattr(socket, 'SOCK_CLOEXEC', 0))
+        self.r_socket: socket.socket = socket.socket(socket.AF_INET, sock_type)
+        # Пакетный прием: при всплеске трафика скопившиеся датаграммы
+        # добираются одним вызовом recvmmsg вместо цикла recvfrom
+        self._batcher = mmsg.RecvBatcher(bufsize=bufsize) if mmsg.available else None
+        # Постоянный буфер приема: recvfrom_into пишет датаграмму
+        # в него без аллокации нового объекта bytes на каждый пакет
+        self._rx_buf = bytearray(bufsize)
+        self._rx_view = memoryview(self._rx_buf)
+        # Кэш префиксов "[ip] " по адресу отправителя: в чате пакеты
+        # идут от небольшого числа хостов, f-строка собирается один
+        # раз на адрес вместо одного раза на пакет
+        self._ip_prefix: dict = {}
+        # Адрес (ip, port) собственного сокета отправки: такие
+        # broadcast-пакеты возвращаются на локальный интерфейс и
+        # отбрасываются до разбора (пользователь видит локальное эхо)
+        self._self_addr = None
+
+    def set_self_addr(self, addr) -> None:
+        """
+        [RU]
+        Задает адрес собственного сокета отправки для фильтрации
+        вернувшихся broadcast-пакетов. Вызывается до start().
+
+        Аргументы:
+            addr (tuple): Пара (ip, port) сокета отправителя.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Sets this process's sender socket address to filter looped
+        back broadcast packets. Call before start().
+
+        Args:
+            addr (tuple): Sender socket (ip, port) pair.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        self._self_addr = addr
+
+    def _handle_datagram(self, data, src_ip: str) -> None:
+        """
+        [RU]
+        Обработка одной принятой датаграммы: разбор и постановка
+        отформатированного сообщения в очередь UI.
+
+        Аргументы:
+            data (bytes | memoryview): Сырые данные датаграммы.
+                memoryview на общий буфер действителен только до
+                следующего приема.
+            src_ip (str): IP адрес отправителя.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Handle one received datagram: parse and enqueue the
+        formatted message for the UI.
+
+        Args:
+            data (bytes | memoryview): Raw datagram data. A
+                memoryview over the shared buffer is only valid
+                until the next receive.
+            src_ip (str): Sender IP address.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        # Парсер принимает bytes напрямую: валидация UTF-8
+        # происходит внутри разбора JSON, без промежуточных
+        # decode/encode проходов по буферу
+        prefix = self._ip_prefix.get(src_ip)
+        if prefix is None:
+            # Ограничение размера кэша на случай подмены адресов
+            # отправителя: редкая полная очистка дешевле учета LRU
+            if len(self._ip_prefix) >= 1024:
+                self._ip_prefix.clear()
+            prefix = f"[{src_ip}] "
+            self._ip_prefix[src_ip] = prefix
+
+        parsed = self.message_handler.parse_incoming_message(data)
+        if parsed is not None:
+            formatted_message = prefix + parsed.nickname + ": " + parsed.message
+        else:
+            # Не JSON или некорректная структура - показываем
+            # как есть (decode с 'replace' не вызывает ошибок)
+            formatted_message = prefix + bytes(data).decode('utf-8', 'replace')
+
+        self.queue.put(formatted_message)
 
     def run(self):
         """
@@ -77,53 +192,118 @@ class UdpReceiverThread(threading.Thread):
             None: Function does not return a value.
         """
         try:
+            # Опциональная привязка потока приема к ядру (например, к
+            # тому, что обслуживает IRQ сетевой карты): данные пакета
+            # остаются горячими в кэше ядра CPU
+            cpu = os.environ.get('CHAT_RX_CPU')
+            if cpu is not None and hasattr(os, 'sched_setaffinity'):
+                try:
+                    os.sched_setaffinity(0, {int(cpu)})
+                    if self.logger:
+                        self.logger.info("Поток приема привязан к CPU %s", cpu)
+                except (ValueError, OSError) as e:
+                    if self.logger:
+                        self.logger.warning("Не удалось привязать поток приема к CPU %s: %s",
+                                            cpu, e)
+
             self.r_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # SO_REUSEPORT (где доступен) позволяет нескольким
+            # экземплярам чата на одном хосте делить порт: ядро само
+            # распределяет датаграммы между сокетами
+            if hasattr(socket, 'SO_REUSEPORT'):
+                self.r_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
             self.r_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            # Увеличенный буфер приема: запас на всплески трафика,
+            # чтобы ядро не теряло датаграммы между вызовами recv
+            self.r_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCK_BUF_SIZE)
+            actual = self.r_socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+            if self.logger and actual < _SOCK_BUF_SIZE:
+                # Ядро урезало запрос до net.core.rmem_max
+                self.logger.info("SO_RCVBUF ограничен ядром: запрошено %s, получено %s",
+                                 _SOCK_BUF_SIZE, actual)
             self.r_socket.bind(("0.0.0.0", self.port))
-            self.r_socket.settimeout(0.2)
+
+            # Неблокирующий сокет + селектор вместо исключения
+            # socket.timeout; setblocking синхронизирует состояние
+            # на платформах без флага SOCK_NONBLOCK
+            self.r_socket.setblocking(False)
+            selector = selectors.DefaultSelector()
+            selector.register(self.r_socket, selectors.EVENT_READ)
+            selector.register(self._wake_r, selectors.EVENT_READ)
+
+            # Локальные ссылки на горячие объекты: без повторного
+            # поиска атрибутов на каждый пакет
+            select = selector.select
+            recvfrom_into = self.r_socket.recvfrom_into
+            handle_datagram = self._handle_datagram
+            rx_buf = self._rx_buf
+            rx_view = self._rx_view
+            batcher = self._batcher
+            logger = self.logger
+            fd = self.r_socket.fileno()
+            self_addr = self._self_addr
 
             while self.running:
                 try:
-                    data, addr = self.r_socket.recvfrom(2048)
-                    src_ip = addr[0]
-                    try:
-                        text = data.decode('utf-8', 'replace')
-
-                        # Очищаем текст от некорректных символов перед JSON парсингом
-                        cleaned_text = text.encode('utf-8', 'replace').decode('utf-8')
-
-                        # Пытаемся парсить как JSON
-                        try:
-                            json_data = json.loads(cleaned_text)
-                            if isinstance(json_data, dict) and 'nickname' in json_data and 'message' in json_data:
-                                nickname = json_data['nickname']
-                                message = json_data['message']
-                                formatted_message = f"[{src_ip}] {nickname}: {message}"
-                            else:
-                                # Некорректная JSON структура - показываем как есть
-                                formatted_message = f"[{src_ip}] {cleaned_text}"
-                        except json.JSONDecodeError:
-                            # Не JSON - показываем как есть
-                            formatted_message = f"[{src_ip}] {cleaned_text}"
-
-                        self.queue.put(formatted_message)
-                    except UnicodeDecodeError:
-                        # Пропускаем некорректные сообщения
+                    # Без таймаута: при тишине в эфире поток спит в
+                    # epoll_wait без периодических пробуждений; stop()
+                    # будит селектор байтом в self-pipe
+                    if not select():
                         continue
-
-                except socket.timeout:
-                    # Таймаут - продолжаем цикл
+                    if not self.running:
+                        break
+                    # Прием в постоянный буфер: без аллокации bytes
+                    # на каждую датаграмму
+                    nbytes, addr = recvfrom_into(rx_buf)
+                    # Отложенное %-форматирование: строка собирается
+                    # только если уровень DEBUG включен
+                    if logger:
+                        logger.debug("Получено сообщение от %s:%s, размер: %s байт",
+                                     addr[0], addr[1], nbytes)
+                    # Собственный broadcast вернулся на локальный
+                    # интерфейс - отбрасываем до разбора
+                    if addr != self_addr:
+                        handle_datagram(rx_view[:nbytes], addr[0])
+
+                    # Всплеск трафика: добираем уже скопившиеся в
+                    # буфере сокета датаграммы одним системным вызовом
+                    if batcher is not None:
+                        for data, addr in batcher.recv(fd):
+                            if addr != self_addr:
+                                handle_datagram(data, addr[0])
+                    else:
+                        # Без recvmmsg: опустошаем буфер сокета
+                        # циклом recvfrom_into до EAGAIN
+                        while True:
+                            try:
+                                nbytes, addr = recvfrom_into(rx_buf)
+                            except BlockingIOError:
+                                break
+                            if addr != self_addr:
+                                handle_datagram(rx_view[:nbytes], addr[0])
+
+                except BlockingIOError:
+                    # Готовность оказалась ложной - ждем дальше
                     continue
                 except OSError:
                     # Сокет закрыт или другая ошибка
                     break
 
+            selector.close()
+
         except Exception as e:
             error_msg = f"Ошибка приема: {e}"
+            if self.logger:
+                self.logger.error(error_msg)
             self.queue.put(error_msg)
         finally:
             if self.r_socket:
                 self.r_socket.close()
+            for fd in (self._wake_r, self._wake_w):
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
 
     def stop(self):
         """
@@ -132,10 +312,10 @@ class UdpReceiverThread(threading.Thread):
 
         Аргументы:
             None: Функция не принимает аргументов.
-            
+
         Возвращает:
             None: Функция не возвращает значение.
-            
+
         [EN]
         Stops the message receiving thread.
 
@@ -145,10 +325,33 @@ class UdpReceiverThread(threading.Thread):
         Returns:
             None: Function does not return a value.
         """
-        self.running = False
+        self._stop_event.set()
+        # Пробуждаем заблокированный select(); os.write безопасен
+        # и из обработчика сигнала
+        try:
+            os.write(self._wake_w, b'\x00')
+        except OSError:
+            pass
         if self.r_socket:
             self.r_socket.close()
 
+    @property
+    def running(self) -> bool:
+        """
+        [RU]
+        Признак работы потока (False после вызова stop()).
+
+        Возвращает:
+            bool: True пока поток не остановлен.
+
+        [EN]
+        Thread running flag (False after stop()).
+
+        Returns:
+            bool: True until the thread is stopped.
+        """
+        return not self._stop_event.is_set()
+
 
 class UdpSenderThread(threading.Thread):
     """
@@ -161,41 +364,271 @@ class UdpSenderThread(threading.Thread):
     Combines sender functionality and UI in one thread.
     """
 
-    def __init__(self, rx_queue: Queue, ip: str, port: int):
+    def __init__(self, rx_queue: SimpleQueue, ip: str, port: int, logger=None,
+                 binary_frames: bool = False):
         """
         [RU]
         Инициализация потока отправки UDP сообщений.
-        
+
         Аргументы:
-            rx_queue (Queue): Очередь входящих сообщений.
+            rx_queue (SimpleQueue): Очередь входящих сообщений.
             ip (str): IP адрес интерфейса для привязки.
             port (int): UDP порт для отправки.
-            
+            logger: Менеджер логирования (опционально).
+            binary_frames (bool): Отправлять бинарные кадры v2
+                вместо JSON.
+
         Возвращает:
             None: Конструктор не возвращает значение.
-            
+
         [EN]
         Initialize UDP message sending thread.
 
         Args:
-            rx_queue (Queue): Incoming message queue.
+            rx_queue (SimpleQueue): Incoming message queue.
             ip (str): IP address of interface to bind.
             port (int): UDP port for sending.
+            logger: Logging manager (optional).
+            binary_frames (bool): Send v2 binary frames instead of
+                JSON.
 
         Returns:
             None: Constructor does not return a value.
         """
         super().__init__(daemon=True)
-        self.rx_queue: Queue = rx_queue
+        self.rx_queue: SimpleQueue = rx_queue
         self.ip: str = ip
         self.port: int = port
-        self.running: bool = True
+        self.logger = logger
+        self.message_handler = MessageHandler(logger=logger,
+                                              binary_frames=binary_frames)
+        self._stop_event = threading.Event()
 
         # Создаем сокет для отправки
         self.s_socket: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.s_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        # Увеличенный буфер отправки: пакетная отправка не упирается
+        # в дефолтный лимит ядра при всплесках
+        self.s_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCK_BUF_SIZE)
+        actual = self.s_socket.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+        if logger and actual < _SOCK_BUF_SIZE:
+            # Ядро урезало запрос до net.core.wmem_max
+            logger.info("SO_SNDBUF ограничен ядром: запрошено %s, получено %s",
+                        _SOCK_BUF_SIZE, actual)
         self.s_socket.bind((ip, 0))  # привязка к указанному интерфейсу со случайным портом
         self.broadcast_addr = ('255.255.255.255', port)
+        # connect() на UDP сокете фиксирует адрес назначения в ядре:
+        # отправка идет через send() без разбора кортежа адреса
+        # на каждый вызов
+        self._connected: bool = False
+        try:
+            self.s_socket.connect(self.broadcast_addr)
+            self._connected = True
+        except OSError:
+            # Нет маршрута к broadcast - остаемся на sendto
+            self._connected = False
+
+        # Пакетная отправка: скопившиеся в очереди сообщения уходят
+        # одним вызовом sendmmsg (требует подключенного сокета)
+        self._send_batcher = (mmsg.SendBatcher()
+                              if mmsg.available and self._connected else None)
+
+        # Nickname сессии; его кодированные представления кэширует
+        # message_handler при установке
+        self.nickname: str = ""
+
+        # Исходящая очередь: UI поток только ставит сообщение,
+        # отправкой занимается отдельный поток
+        self._outq: Queue = Queue(maxsize=1024)
+        self._tx_worker = threading.Thread(target=self._tx_loop, daemon=True)
+        self._tx_worker.start()
+
+    def _tx_loop(self) -> None:
+        """
+        [RU]
+        Цикл потока отправки: забирает сообщения из исходящей
+        очереди и отправляет их в сеть.
+
+        Аргументы:
+            None: Функция не принимает аргументов.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Sender worker loop: takes messages from the outbound queue
+        and sends them to the network.
+
+        Args:
+            None: Function does not accept arguments.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        # Локальные ссылки на горячие методы очереди
+        outq_get = self._outq.get
+        outq_get_nowait = self._outq.get_nowait
+
+        while self.running:
+            try:
+                nickname, message = outq_get(timeout=0.2)
+            except Empty:
+                continue
+
+            # Добираем скопившиеся сообщения: при всплеске они
+            # уходят одной пачкой вместо вызова на каждое
+            pending = [(nickname, message)]
+            while len(pending) < 16:
+                try:
+                    pending.append(outq_get_nowait())
+                except Empty:
+                    break
+
+            if len(pending) > 1 and self._send_batcher is not None:
+                self._send_batch(pending)
+            else:
+                for nickname, message in pending:
+                    try:
+                        self.send_datagram(nickname, message)
+                    except RuntimeError as e:
+                        # Ошибка отправки показывается в ленте сообщений
+                        self.rx_queue.put(str(e))
+
+        # Остановка запрошена - досылаем то, что успело встать
+        # в очередь, пока сокет еще открыт
+        pending = []
+        while True:
+            try:
+                pending.append(outq_get_nowait())
+            except Empty:
+                break
+        for nickname, message in pending:
+            try:
+                self.send_datagram(nickname, message)
+            except RuntimeError:
+                break
+
+    def _send_batch(self, pending) -> None:
+        """
+        [RU]
+        Отправляет пачку сообщений одним вызовом sendmmsg.
+
+        Аргументы:
+            pending (list): Пары (nickname, message) для отправки.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Sends a batch of messages in one sendmmsg call.
+
+        Args:
+            pending (list): (nickname, message) pairs to send.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        payloads = []
+        for nickname, message in pending:
+            try:
+                payloads.append(self.message_handler.build_outgoing_message(nickname, message))
+            except ValueError as e:
+                self.rx_queue.put(str(e))
+
+        fd = self.s_socket.fileno()
+        sent = 0
+        try:
+            while sent < len(payloads):
+                n = self._send_batcher.send(fd, payloads[sent:])
+                if n <= 0:
+                    # EAGAIN/EINTR: остаток досылается поштучно ниже
+                    break
+                sent += n
+            if self.logger:
+                self.logger.debug("Отправлена пачка из %s сообщений", sent)
+        except OSError as e:
+            if self.logger:
+                self.logger.error("Ошибка пакетной отправки: %s", e)
+
+        # Недоотправленный хвост уходит поштучно блокирующим send:
+        # как и в одиночном пути, каждая ошибка видна пользователю,
+        # сообщения не теряются молча
+        for payload in payloads[sent:]:
+            try:
+                self.s_socket.send(payload)
+                sent += 1
+            except OSError as e:
+                if self.logger:
+                    self.logger.error("Ошибка отправки: %s", e)
+                self.rx_queue.put(
+                        f"Ошибка отправки: {len(payloads) - sent} сообщений не отправлено ({e})"
+                        )
+                break
+
+    def set_nickname(self, nickname: str) -> None:
+        """
+        [RU]
+        Устанавливает nickname сессии; байтовые представления для
+        пути отправки кэширует message_handler.
+
+        Аргументы:
+            nickname (str): Имя пользователя.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Sets the session nickname; the byte representations for the
+        send path are cached by message_handler.
+
+        Args:
+            nickname (str): User nickname.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        self.nickname = nickname.strip()
+        self.message_handler.set_nickname(self.nickname)
+
+    def queue_message(self, nickname: str, message: str) -> None:
+        """
+        [RU]
+        Ставит сообщение в исходящую очередь без ожидания отправки.
+        Проверка длины выполняется сразу, чтобы пользователь видел
+        ошибку синхронно.
+
+        Аргументы:
+            nickname (str): Имя пользователя.
+            message (str): Текст сообщения для отправки.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Enqueues a message for sending without waiting for the send.
+        The length check runs synchronously so the user sees the
+        error immediately.
+
+        Args:
+            nickname (str): User nickname.
+            message (str): Text message to send.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        if not self.message_handler.validate_message_length(message):
+            raise ValueError(
+                    f"Сообщение слишком длинное: {len(message.encode('utf-8'))} байт "
+                    f"(максимум {self.message_handler.max_message_size})"
+                    )
+        try:
+            self._outq.put_nowait((nickname, message))
+        except Full:
+            raise RuntimeError("Очередь отправки переполнена")
+
+        # Локальное эхо: собственное сообщение показывается сразу,
+        # без сетевого круга broadcast -> прием -> разбор
+        self.rx_queue.put(f"[{self.ip}] {nickname}: {message}")
 
     def send_datagram(self, nickname: str, message: str) -> None:
         """
@@ -220,21 +653,20 @@ class UdpSenderThread(threading.Thread):
             None: Function does not return a value.
         """
         try:
-            # Проверяем message на объем не более 1000 байт
-            message_bytes = message.encode('utf-8')
-            if len(message_bytes) > 1000:
-                raise ValueError(f"Сообщение слишком длинное: {len(message_bytes)} байт (максимум 1000)")
-
-            # Формируем JSON структуру
-            json_data = {
-                    "nickname": nickname,
-                    "message" : message
-                    }
-
-            # Упаковываем в JSON и отправляем
-            data = json.dumps(json_data, ensure_ascii=False).encode('utf-8')
-            self.s_socket.sendto(data, self.broadcast_addr)
+            # Сборка датаграммы (включая проверку длины) и отправка
+            data = self.message_handler.build_outgoing_message(nickname, message)
+            if self._connected:
+                self.s_socket.send(data)
+            else:
+                self.s_socket.sendto(data, self.broadcast_addr)
+            # Отложенное %-форматирование: строка собирается только
+            # если уровень DEBUG включен
+            if self.logger:
+                self.logger.debug("Отправлено %s байт на %s:%s",
+                                  len(data), self.broadcast_addr[0], self.broadcast_addr[1])
         except Exception as e:
+            if self.logger:
+                self.logger.error("Ошибка отправки: %s", e)
             raise RuntimeError(f"Ошибка отправки: {e}")
 
     def _ui_entry(self, stdscr, rx_queue, ip, port):
@@ -244,7 +676,7 @@ class UdpSenderThread(threading.Thread):
         
         Аргументы:
             stdscr: Объект окна curses.
-            rx_queue (Queue): Очередь входящих сообщений.
+            rx_queue (SimpleQueue): Очередь входящих сообщений.
             ip (str): IP адрес интерфейса.
             port (int): UDP порт.
             
@@ -256,7 +688,7 @@ class UdpSenderThread(threading.Thread):
 
         Args:
             stdscr: Curses window object.
-            rx_queue (Queue): Incoming message queue.
+            rx_queue (SimpleQueue): Incoming message queue.
             ip (str): Interface IP address.
             port (int): UDP port.
 
@@ -334,5 +766,50 @@ class UdpSenderThread(threading.Thread):
         Returns:
             None: Function does not return a value.
         """
-        self.running = False
+        self._stop_event.set()
+        # Сокет закрывается только после того, как поток отправки
+        # дошлет накопившиеся в очереди сообщения: закрытие до
+        # завершения слива роняло их с EBADF
+        self._tx_worker.join(timeout=1)
         self.close_socket()
+
+    def request_stop(self) -> None:
+        """
+        [RU]
+        Запрашивает остановку потока без закрытия сокета.
+        Безопасно для вызова из обработчика сигнала.
+
+        Аргументы:
+            None: Функция не принимает аргументов.
+
+        Возвращает:
+            None: Функция не возвращает значение.
+
+        [EN]
+        Requests thread stop without closing the socket.
+        Safe to call from a signal handler.
+
+        Args:
+            None: Function does not accept arguments.
+
+        Returns:
+            None: Function does not return a value.
+        """
+        self._stop_event.set()
+
+    @property
+    def running(self) -> bool:
+        """
+        [RU]
+        Признак работы потока (False после вызова stop()).
+
+        Возвращает:
+            bool: True пока поток не остановлен.
+
+        [EN]
+        Thread running flag (False after stop()).
+
+        Returns:
+            bool: True until the thread is stopped.
+        """
+        return not self._stop_event.is_set()
@@ -9,7 +9,7 @@ Main chat user interface class.
 """
 
 import curses
-from queue import Queue, Empty
+from queue import Empty, SimpleQueue
 
 from .input_handler import InputHandler
 from .message_display import MessageDisplay
@@ -26,7 +26,7 @@ class CursesChatUI:
     Curses-based chat user interface with component composition.
     """
 
-    def __init__(self, stdscr, sender_thread, rx_queue: Queue, iface_ip: str, port: int):
+    def __init__(self, stdscr, sender_thread, rx_queue: SimpleQueue, iface_ip: str, port: int):
         """
         [RU]
         Инициализация UI чата.
@@ -34,7 +34,7 @@ class CursesChatUI:
         Аргументы:
             stdscr: Объект окна curses.
             sender_thread: Экземпляр UdpSenderThread.
-            rx_queue (Queue): Очередь входящих сообщений.
+            rx_queue (SimpleQueue): Очередь входящих сообщений.
             iface_ip (str): IP адрес интерфейса.
             port (int): UDP порт.
 
@@ -47,7 +47,7 @@ class CursesChatUI:
         Args:
             stdscr: Curses window object.
             sender_thread: UdpSenderThread instance.
-            rx_queue (Queue): Incoming message queue.
+            rx_queue (SimpleQueue): Incoming message queue.
             iface_ip (str): Interface IP address.
             port (int): UDP port.
 
@@ -56,7 +56,7 @@ class CursesChatUI:
         """
         self.stdscr: curses.window = stdscr
         self.sender_thread = sender_thread
-        self.rx_queue: Queue = rx_queue
+        self.rx_queue: SimpleQueue = rx_queue
         self.iface_ip: str = iface_ip
         self.port: int = port
 
@@ -66,9 +66,39 @@ class CursesChatUI:
         self.input_handler = InputHandler(stdscr, sender_thread, self.renderer)
         self.message_display = MessageDisplay(stdscr, self.window_manager, self.renderer)
 
+        # Неизменяемая часть статусной строки вычисляется один раз
+        self._status_prefix: str = f"iface={iface_ip}:{port} | nickname: "
+
         # Состояние UI
         self._is_full_redraw_needed: bool = True
 
+    def _build_status_text(self) -> str:
+        """
+        [RU]
+        Сборка текста статусной строки из кэшированного префикса
+        и изменяемых полей.
+
+        Аргументы:
+            None: Функция не принимает аргументов.
+
+        Возвращает:
+            str: Текст статусной строки.
+
+        [EN]
+        Build status line text from the cached prefix and the
+        mutable fields.
+
+        Args:
+            None: Function does not accept arguments.
+
+        Returns:
+            str: Status line text.
+        """
+        return (self._status_prefix
+                + (self.input_handler.get_nickname() or '---')
+                + " | status: "
+                + self.input_handler.get_status())
+
     def _create_windows(self) -> None:
         """
         [RU]
@@ -145,8 +175,7 @@ class CursesChatUI:
             None: Function does not return a value.
         """
         # Отрисовка статуса
-        status_text = f"iface={self.iface_ip}:{self.port} | nickname: {self.input_handler.get_nickname() or '---'} | status: {self.input_handler.get_status()}"
-        self.renderer.draw_status(status_text)
+        self.renderer.draw_status(self._build_status_text())
 
         # Отрисовка сообщений
         self.message_display.draw()
@@ -198,14 +227,17 @@ class CursesChatUI:
         Returns:
             None: Function does not return a value.
         """
+        # Не более 16 сообщений за цикл UI: все они попадают в одну
+        # перерисовку, а при шторме пакетов цикл не зависает в
+        # бесконечном опустошении очереди и продолжает читать ввод
         message_count = 0
-        while True:
+        while message_count < 16:
             try:
                 msg = self.rx_queue.get_nowait()
-                self.message_display.add_message(msg)
-                message_count += 1
             except Empty:
                 break
+            self.message_display.add_message(msg)
+            message_count += 1
 
         # Обновляем статус если получены сообщения
         if message_count > 0:
@@ -268,10 +300,11 @@ class CursesChatUI:
                     self._focus_input_caret()
                     self._is_full_redraw_needed = False
                 else:
-                    # Отрисовка компонентов с проверкой dirty flags
+                    # Отрисовка компонентов с проверкой dirty flags;
+                    # текст статуса собирается только при изменении
                     self.message_display.draw()
-                    status_text = f"iface={self.iface_ip}:{self.port} | nickname: {self.input_handler.get_nickname() or '---'} | status: {self.input_handler.get_status()}"
-                    self.renderer.draw_status(status_text)
+                    if self.renderer.is_status_dirty():
+                        self.renderer.draw_status(self._build_status_text())
                     self.input_handler.draw()
 
                     # Фокусировка курсора после отрисовки
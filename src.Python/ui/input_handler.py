@@ -11,6 +11,10 @@ User input handler.
 import curses
 from .base_ui import BaseUI
 
+# Команды выхода из чата: frozenset для O(1) проверки без
+# пересоздания списка на каждый ввод
+_QUIT_CMDS = frozenset(('/quit', '/exit', '/q'))
+
 
 class InputHandler(BaseUI):
     """
@@ -208,8 +212,11 @@ class InputHandler(BaseUI):
         Returns:
             None: Function does not return a value.
         """
-        if self.input_buffer.strip():
-            self.nickname = self.input_buffer.strip()
+        nickname = self.input_buffer.strip()
+        if nickname:
+            self.nickname = nickname
+            # Кэшируем nickname (и его байты) на пути отправки
+            self.sender_thread.set_nickname(nickname)
             self.input_mode = "message"
             self.input_buffer = ""
             self.update_status("Enter message")
@@ -237,10 +244,16 @@ class InputHandler(BaseUI):
         Returns:
             None: Function does not return a value.
         """
-        if self.input_buffer.strip():
+        message = self.input_buffer.strip()
+        if message:
+            if message.lower() in _QUIT_CMDS:
+                self.update_status("Quit")
+                self.sender_thread.stop()
+                return
             try:
-                message = self.input_buffer.strip()
-                self.sender_thread.send_datagram(self.nickname, message)
+                # Отправка без ожидания: сообщение уходит через
+                # исходящую очередь потока отправки
+                self.sender_thread.queue_message(self.nickname, message)
                 self.input_buffer = ""
                 self.update_status("Message sent")
             except Exception as e:
@@ -72,6 +72,30 @@ class UIRenderer(BaseUI):
         """
         self._dirty_status = True
 
+    def is_status_dirty(self) -> bool:
+        """
+        [RU]
+        Проверка флага перерисовки блока статуса. Позволяет
+        вызывающему коду не собирать текст статуса впустую.
+
+        Аргументы:
+            None: Функция не принимает аргументов.
+
+        Возвращает:
+            bool: True если статус требует перерисовки.
+
+        [EN]
+        Check the status block redraw flag. Lets callers avoid
+        building the status text for nothing.
+
+        Args:
+            None: Function does not accept arguments.
+
+        Returns:
+            bool: True if the status needs a redraw.
+        """
+        return self._dirty_status
+
     def set_input_dirty(self) -> None:
         """
         [RU]